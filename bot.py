@@ -1,20 +1,39 @@
 import os
 import re
+import asyncio
+import functools
+import time
+import pickle
+import queue
+import atexit
 import logging
-from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from logging.handlers import QueueHandler, QueueListener
+import ahocorasick
+from telegram import Message, Update
+from telegram.ext import Application, ChatMemberHandler, CommandHandler, MessageHandler, filters, ContextTypes
 from telegram.constants import ChatMemberStatus
 
-# Configure logging
+try:
+    import uvloop  # Optional faster event loop
+except ImportError:
+    uvloop = None
+
+# Configure logging (records are written from a background thread)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
+    level=logging.INFO,
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 # Bot configuration
 BOT_TOKEN = os.getenv('BOT_TOKEN')
 ADMIN_IDS = [5727413041, -1002139907201]  # Your admin IDs
+STATE_PATH = os.getenv('STATE_PATH', 'state.pkl')  # Saved word lists
 
 # Storage for flagged and banned words
 flagged_words = set()
@@ -23,9 +42,344 @@ auto_delete_links = False
 auto_delete_joins = True  # New: Auto delete join messages
 auto_delete_promotions = True  # New: Auto delete promotional messages
 
+# Batched deletes: wait this long for more hits in the same chat, up to the API limit
+_DELETE_BATCH_DELAY = 0.2
+_DELETE_BATCH_MAX = 100
+
+# Admin status cache: (chat_id, user_id) -> (timestamp, is_admin)
+_ADMIN_TTL = 60.0
+_admin_cache: dict[tuple[int, int], tuple[float, bool]] = {}
+_bot_admin_cache: dict[int, tuple[float, bool]] = {}
+
+def _store_admin_status(cache: dict, key, result: bool):
+    """Cache an admin lookup and evict entries that have expired"""
+    now = time.monotonic()
+    # Re-insert so the dict stays ordered oldest first
+    cache.pop(key, None)
+    cache[key] = (now, result)
+    while True:
+        oldest = next(iter(cache))
+        if now - cache[oldest][0] < _ADMIN_TTL:
+            break
+        del cache[oldest]
+
+# Combined link pattern (URLs, www., t.me links, bare domains, @user.domain)
+# Bare domains only match from the start of a dotted run, which keeps the scan linear
+_LINK_RE = re.compile(
+    r'(?i)(?:https?://\S+'
+    r'|www\.\S+'
+    r'|t\.me/\w+'
+    r'|(?<![a-z0-9.-])(?:[a-z0-9-]+\.)+[a-z]{2,}'
+    r'|@\w+\.\w+)'
+)
+
+def _may_have_link(text: str) -> bool:
+    """Cheap pre-check: every link shape above contains either '.' or '://'"""
+    return '.' in text or '://' in text
+
+def _has_link(text: str) -> bool:
+    """Check text for links, skipping the regex when no link is possible"""
+    return _may_have_link(text) and _LINK_RE.search(text) is not None
+
+# Promotional keywords
+_PROMO_KEYWORDS = [
+    'airdrop', 'drop', 'token', 'coin', 'crypto', 'free', 'earn', 'profit',
+    'refer', 'referral', 'bonus', 'reward', 'withdrawal', 'withdraw',
+    'meta core', 'metacore', 'base', 'network issue', 'server issue',
+    'notice from', 'dear users', 'currently experiencing', 'team is working',
+    'continue referring', 'more you refer', 'thanks for your patience'
+]
+_PROMO_AUTOMATON = ahocorasick.Automaton()
+for _order, _keyword in enumerate(_PROMO_KEYWORDS):
+    _PROMO_AUTOMATON.add_word(_keyword, (_order, _keyword))
+_PROMO_AUTOMATON.make_automaton()
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _whole_word_end(text: str, end: int):
+    """Return where a keyword ending at end stops as a whole word (plural 's'/'es' allowed), or None"""
+    for suffix in ('es', 's', ''):
+        last = end + len(suffix)
+        if text.startswith(suffix, end + 1) and (last + 1 >= len(text) or not _is_word_char(text[last + 1])):
+            return last
+    return None
+
+def _count_promo_keywords(text_lower: str) -> int:
+    """Count distinct promotional keywords that appear as whole words (plurals included)"""
+    # Gather whole-word hits by start position; among hits sharing a start
+    # the earliest keyword in _PROMO_KEYWORDS wins, as in a regex alternation
+    hits = {}
+    for end, (order, keyword) in _PROMO_AUTOMATON.iter(text_lower):
+        start = end - len(keyword) + 1
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        end = _whole_word_end(text_lower, end)
+        if end is None:
+            continue
+        if start not in hits or order < hits[start][0]:
+            hits[start] = (order, keyword, end)
+    
+    # Take hits left to right, skipping any that overlap an accepted one
+    found = set()
+    next_start = 0
+    for start in sorted(hits):
+        if start >= next_start:
+            _, keyword, end = hits[start]
+            found.add(keyword)
+            next_start = end + 1
+    return len(found)
+
+def _has_bot_mention(text_lower: str) -> bool:
+    """Check for an @mention whose word ends in 'bot', e.g. @airdropbot"""
+    i = text_lower.find('@')
+    while i >= 0:
+        j = i + 1
+        while j < len(text_lower) and _is_word_char(text_lower[j]):
+            j += 1
+        if text_lower.endswith('bot', i + 1, j):
+            return True
+        i = text_lower.find('@', j)
+    return False
+
+# Emojis counted for the excessive emoji check (without the U+FE0F variation selector)
+_PROMO_EMOJIS = ('❗', '🔥', '✅', '➡')
+
+# Specific promotional patterns, combined into one alternation
+# (gaps are bounded so a miss cannot rescan the rest of the message)
+_PROMO_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in [
+        r'notice from.{0,40}core',
+        r'dear users.{0,60}experiencing',
+        r'server.{0,20}issue.{0,60}withdrawal',
+        r'continue.{0,20}referring.{0,20}friends',
+        r'more you refer.{0,40}profit',
+        r'thanks.{0,20}patience.{0,40}support',
+        r'[❗️]{3,}.{0,80}@\w*bot.{0,80}[❗️]{3,}',
+        r'✅@\w*bot\s*➡️@\w*bot\s*✅@\w*bot'
+    ]),
+    re.IGNORECASE | re.DOTALL
+)
+
+# Single automaton over flagged and banned words, rebuilt lazily after changes
+_word_sets = {'flagged': flagged_words, 'banned': banned_words}
+_automaton = ahocorasick.Automaton()
+_automaton_dirty = False
+_min_word_len = 0  # Texts shorter than this cannot contain any word
+_REBUILD_DELAY = 0.2  # Seconds to coalesce bursts of /flag and /ban
+_rebuild_handle = None
+
+def _update_min_word_len():
+    global _min_word_len
+    _min_word_len = min(map(len, flagged_words | banned_words), default=0)
+
+def _add_word(word: str, kind: str):
+    """Add word to the flagged/banned list and the automaton"""
+    global _automaton_dirty
+    _word_sets[kind].add(word)
+    # Flagged takes precedence when a word is in both lists
+    if kind == 'flagged' or word not in flagged_words:
+        _automaton.add_word(word, (kind, word))
+        _automaton_dirty = True
+    _update_min_word_len()
+    _schedule_rebuild()
+
+def _remove_word(word: str, kind: str):
+    """Remove word from the flagged/banned list and the automaton"""
+    global _automaton_dirty
+    _word_sets[kind].discard(word)
+    if word in flagged_words:
+        _automaton.add_word(word, ('flagged', word))
+    elif word in banned_words:
+        _automaton.add_word(word, ('banned', word))
+    else:
+        _automaton.remove_word(word)
+    _automaton_dirty = True
+    _update_min_word_len()
+    _schedule_rebuild()
+
+def _schedule_rebuild():
+    """Rebuild and save once a burst of word changes has settled"""
+    global _rebuild_handle
+    if _rebuild_handle:
+        _rebuild_handle.cancel()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _rebuild()  # No event loop (e.g. at startup), rebuild right away
+        return
+    _rebuild_handle = loop.call_later(_REBUILD_DELAY, _rebuild)
+
+def _rebuild():
+    """Build the automaton if it changed and save the word lists"""
+    global _automaton_dirty, _rebuild_handle
+    _rebuild_handle = None
+    if _automaton_dirty and len(_automaton):
+        _automaton.make_automaton()
+        _automaton_dirty = False
+    _save_state()
+
+def _save_state():
+    """Save word lists to STATE_PATH"""
+    tmp_path = f"{STATE_PATH}.tmp"
+    try:
+        # Write next to STATE_PATH and swap it in, so a crash never truncates it
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((flagged_words, banned_words), f)
+        os.replace(tmp_path, STATE_PATH)
+    except Exception as e:
+        logger.error(f"Failed to save state: {e}")
+
+def _load_state():
+    """Restore word lists saved by _save_state and rebuild the automaton"""
+    global _automaton_dirty
+    try:
+        with open(STATE_PATH, 'rb') as f:
+            flagged, banned = pickle.load(f)
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        # Keep the unreadable file aside so the next save cannot overwrite it
+        backup_path = f"{STATE_PATH}.corrupt"
+        logger.error(f"Failed to load state: {e}; moving it to {backup_path}")
+        try:
+            os.replace(STATE_PATH, backup_path)
+        except OSError as e:
+            logger.error(f"Failed to move state file: {e}")
+        return
+    flagged_words.update(flagged)
+    banned_words.update(banned)
+    # Flagged takes precedence when a word is in both lists
+    for word in banned_words:
+        _automaton.add_word(word, ('banned', word))
+    for word in flagged_words:
+        _automaton.add_word(word, ('flagged', word))
+    if len(_automaton):
+        _automaton.make_automaton()
+    _automaton_dirty = False
+    _update_min_word_len()
+    logger.info(f"Loaded {len(flagged_words)} flagged and {len(banned_words)} banned words")
+
+def _find_word(text: str, text_lower: str = None):
+    """Return (kind, word) for the first flagged/banned word in text, or None"""
+    global _automaton_dirty
+    if not len(_automaton) or len(text) < _min_word_len:
+        return None
+    if _automaton_dirty:  # Message arrived before the scheduled rebuild
+        _automaton.make_automaton()
+        _automaton_dirty = False
+    # Words are stored lowercase, so only the scanned copy needs lowering
+    if text_lower is None:
+        text_lower = text.lower()
+    hit = next(_automaton.iter(text_lower), None)
+    return hit[1] if hit else None
+
+def _parse_toggle(args, current: bool):
+    """Return the new value for an on/off command, or None for a bad argument"""
+    if not args:
+        return not current
+    arg = args[0].lower()
+    if arg in ['on', 'enable', '1', 'true']:
+        return True
+    if arg in ['off', 'disable', '0', 'false']:
+        return False
+    return None
+
+def admin_only(handler):
+    """Only run the command handler for admins, replying with an error otherwise"""
+    @functools.wraps(handler)
+    async def wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if not await self.is_admin(update, context):
+            await update.message.reply_text("❌ Only admins can use this command!")
+            return
+        return await handler(self, update, context)
+    return wrapper
+
+# Reply templates
+_START_TEMPLATE = """🤖 **Hello Admin! Message Deleter Bot is now enabled!**
+
+**Available Commands:**
+• `/flag <word>` - Add word to flag list (auto-delete)
+• `/ban <word>` - Add word to ban list (auto-delete)
+• `/unflag <word>` - Remove word from flag list
+• `/unban <word>` - Remove word from ban list
+• `/list` - Show all flagged and banned words
+• `/links on/off` - Toggle automatic link deletion
+• `/joins on/off` - Toggle join/leave message deletion
+• `/promos on/off` - Toggle promotional message deletion
+• `/help` - Show this help message
+
+**Current Status:**
+• Flagged words: {flagged_count}
+• Banned words: {banned_count}
+• Link deletion: {link_status}
+• Join message deletion: {join_status}
+• Promotional message deletion: {promo_status}
+
+Send me flagged or banned words to start protecting your group! 🛡️"""
+
+_HELP_TEXT = """🤖 **Message Deleter Bot Help**
+
+**Commands:**
+• `/start` - Initialize bot and show status
+• `/flag <word>` - Add word to auto-delete list
+• `/ban <word>` - Add word to ban list (same as flag)
+• `/unflag <word>` - Remove word from flag list
+• `/unban <word>` - Remove word from ban list
+• `/list` - Show all settings and word lists
+• `/links on/off` - Toggle automatic link deletion
+• `/joins on/off` - Toggle join/leave message deletion
+• `/promos on/off` - Toggle promotional message deletion
+• `/help` - Show this help message
+
+**Examples:**
+• `/flag scam` - Delete messages containing "scam"
+• `/ban help` - Delete messages containing "help"
+• `/links on` - Enable automatic link deletion
+• `/joins on` - Enable join message deletion
+• `/promos on` - Enable promotional message deletion
+
+**Features:**
+• Automatically deletes messages with flagged/banned words
+• Can delete messages containing links (when enabled)
+• Deletes join/leave messages (when enabled)
+• Detects and deletes promotional/spam messages (when enabled)
+• Only admins can control the bot
+• Works only when bot has admin privileges
+
+**Promotional Message Detection:**
+The bot can detect promotional messages by looking for:
+• Airdrop/token/crypto related keywords
+• Bot mentions with promotional content
+• Excessive emoji usage with promotional content
+• Specific spam patterns
+
+**Note:** Bot must be admin in the group to delete messages!"""
+
+_LIST_STATUS_TEMPLATE = """
+🔗 **Link Deletion:** {link_status}
+👋 **Join Message Deletion:** {join_status}
+📢 **Promotional Message Deletion:** {promo_status}"""
+
+class SuspiciousTextFilter(filters.MessageFilter):
+    """Only pass text messages that could need deleting (cheap checks only)"""
+    
+    def filter(self, message: Message) -> bool:
+        if auto_delete_promotions:
+            return True  # Promotional detection needs every message
+        text = message.text or ""
+        # The word scan itself runs once, in monitor_messages
+        if (flagged_words or banned_words) and len(text) >= _min_word_len:
+            return True
+        return auto_delete_links and _may_have_link(text)
+
 class MessageDeleterBot:
     def __init__(self):
-        self.application = Application.builder().token(BOT_TOKEN).build()
+        _load_state()
+        # Per-chat messages waiting for a batched delete: chat_id -> [(message_id, username, reason)]
+        self._pending_deletes: dict[int, list[tuple[int, str, str]]] = {}
+        self._flush_handles: dict[int, asyncio.TimerHandle] = {}
+        self.application = Application.builder().token(BOT_TOKEN).post_stop(self.flush_all_deletes).build()
         self.setup_handlers()
         # Add error handler
         self.application.add_error_handler(self.error_handler)
@@ -50,14 +404,18 @@ class MessageDeleterBot:
         
         # Message handlers
         self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self.monitor_messages)
+            MessageHandler(filters.TEXT & ~filters.COMMAND & SuspiciousTextFilter(), self.monitor_messages)
         )
         # New: Handler for service messages (join/leave)
         self.application.add_handler(
-            MessageHandler(filters.StatusUpdate.NEW_CHAT_MEMBERS, self.delete_join_message)
+            MessageHandler(
+                filters.StatusUpdate.NEW_CHAT_MEMBERS | filters.StatusUpdate.LEFT_CHAT_MEMBER,
+                self.delete_service_message
+            )
         )
+        # Drop cached admin status when member rights change
         self.application.add_handler(
-            MessageHandler(filters.StatusUpdate.LEFT_CHAT_MEMBER, self.delete_leave_message)
+            ChatMemberHandler(self.track_chat_member, ChatMemberHandler.ANY_CHAT_MEMBER)
         )
     
     async def is_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
@@ -69,49 +427,57 @@ class MessageDeleterBot:
         if user_id in ADMIN_IDS:
             return True
         
+        key = (chat_id, user_id)
+        cached = _admin_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _ADMIN_TTL:
+            return cached[1]
+        
         # Check if user is admin/creator in the group
         try:
             member = await context.bot.get_chat_member(chat_id, user_id)
-            return member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]
+            result = member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]
         except:
             return False
+        _store_admin_status(_admin_cache, key, result)
+        return result
     
     async def is_bot_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
         """Check if bot is admin in the group"""
+        chat_id = update.effective_chat.id
+        cached = _bot_admin_cache.get(chat_id)
+        if cached and time.monotonic() - cached[0] < _ADMIN_TTL:
+            return cached[1]
+        
         try:
             bot_member = await context.bot.get_chat_member(
-                update.effective_chat.id, 
+                chat_id, 
                 context.bot.id
             )
-            return bot_member.status == ChatMemberStatus.ADMINISTRATOR
+            result = bot_member.status == ChatMemberStatus.ADMINISTRATOR
         except:
             return False
+        _store_admin_status(_bot_admin_cache, chat_id, result)
+        return result
     
-    def is_promotional_message(self, text: str) -> bool:
+    async def track_chat_member(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Invalidate cached admin status for the updated member"""
+        member_update = update.chat_member or update.my_chat_member
+        chat_id = member_update.chat.id
+        _admin_cache.pop((chat_id, member_update.new_chat_member.user.id), None)
+        if update.my_chat_member:
+            _bot_admin_cache.pop(chat_id, None)
+    
+    def is_promotional_message(self, text: str, text_lower: str = None) -> bool:
         """Check if message is promotional based on patterns"""
-        text_lower = text.lower()
-        
-        # Promotional keywords
-        promo_keywords = [
-            'airdrop', 'drop', 'token', 'coin', 'crypto', 'free', 'earn', 'profit',
-            'refer', 'referral', 'bonus', 'reward', 'withdrawal', 'withdraw',
-            'meta core', 'metacore', 'base', 'network issue', 'server issue',
-            'notice from', 'dear users', 'currently experiencing', 'team is working',
-            'continue referring', 'more you refer', 'thanks for your patience'
-        ]
-        
-        # Bot mentions pattern
-        bot_mention_pattern = r'@\w*bot\b'
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Excessive emoji patterns
-        excessive_emoji_pattern = r'[❗️🔥✅➡️]{5,}'
-        
-        # Check for promotional keywords (at least 2 matches)
-        keyword_matches = sum(1 for keyword in promo_keywords if keyword in text_lower)
+        # Count distinct promotional keywords (at least 2 matches)
+        keyword_matches = _count_promo_keywords(text_lower)
         
         # Check patterns
-        has_bot_mentions = bool(re.search(bot_mention_pattern, text, re.IGNORECASE))
-        has_excessive_emojis = bool(re.search(excessive_emoji_pattern, text))
+        has_bot_mentions = _has_bot_mention(text_lower)
+        has_excessive_emojis = sum(map(text.count, _PROMO_EMOJIS)) >= 5
         
         # Promotional message criteria
         if keyword_matches >= 2:  # At least 2 promotional keywords
@@ -124,284 +490,201 @@ class MessageDeleterBot:
             return True
         
         # Check for specific promotional patterns
-        promotional_patterns = [
-            r'notice from.*core',
-            r'dear users.*experiencing',
-            r'server.*issue.*withdrawal',
-            r'continue.*referring.*friends',
-            r'more you refer.*profit',
-            r'thanks.*patience.*support',
-            r'[❗️]{3,}.*@\w*bot.*[❗️]{3,}',
-            r'✅@\w*bot\s*➡️@\w*bot\s*✅@\w*bot'
-        ]
-        
-        for pattern in promotional_patterns:
-            if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
-                return True
-        
-        return False
-    
-    async def delete_join_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Delete join messages"""
-        if auto_delete_joins and await self.is_bot_admin(update, context):
-            try:
-                await update.message.delete()
-                logger.info("Deleted join message")
-            except Exception as e:
-                logger.error(f"Failed to delete join message: {e}")
+        return _PROMO_RE.search(text) is not None
     
-    async def delete_leave_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Delete leave messages"""
-        if auto_delete_joins and await self.is_bot_admin(update, context):
-            try:
-                await update.message.delete()
-                logger.info("Deleted leave message")
-            except Exception as e:
-                logger.error(f"Failed to delete leave message: {e}")
+    async def delete_service_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Delete join/leave messages"""
+        if not auto_delete_joins:
+            return
+        
+        # No bot admin pre-check: the delete fails cheaply without rights
+        kind = "join" if update.message.new_chat_members else "leave"
+        try:
+            await update.message.delete()
+            logger.info(f"Deleted {kind} message")
+        except Exception as e:
+            logger.error(f"Failed to delete {kind} message: {e}")
     
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command - only respond to admins"""
         if not await self.is_admin(update, context):
             return  # Don't reply if not admin
         
-        # Fix the string formatting issue
-        link_status = "ON" if auto_delete_links else "OFF"
-        join_status = "ON" if auto_delete_joins else "OFF"
-        promo_status = "ON" if auto_delete_promotions else "OFF"
-        
-        welcome_message = f"""🤖 **Hello Admin! Message Deleter Bot is now enabled!**
-
-**Available Commands:**
-• `/flag <word>` - Add word to flag list (auto-delete)
-• `/ban <word>` - Add word to ban list (auto-delete)
-• `/unflag <word>` - Remove word from flag list
-• `/unban <word>` - Remove word from ban list
-• `/list` - Show all flagged and banned words
-• `/links on/off` - Toggle automatic link deletion
-• `/joins on/off` - Toggle join/leave message deletion
-• `/promos on/off` - Toggle promotional message deletion
-• `/help` - Show this help message
-
-**Current Status:**
-• Flagged words: {len(flagged_words)}
-• Banned words: {len(banned_words)}
-• Link deletion: {link_status}
-• Join message deletion: {join_status}
-• Promotional message deletion: {promo_status}
-
-Send me flagged or banned words to start protecting your group! 🛡️"""
+        welcome_message = _START_TEMPLATE.format(
+            flagged_count=len(flagged_words),
+            banned_count=len(banned_words),
+            link_status="ON" if auto_delete_links else "OFF",
+            join_status="ON" if auto_delete_joins else "OFF",
+            promo_status="ON" if auto_delete_promotions else "OFF"
+        )
         
         await update.message.reply_text(welcome_message, parse_mode='Markdown')
     
+    @admin_only
     async def toggle_joins(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Toggle automatic join/leave message deletion"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
         global auto_delete_joins
         
-        if context.args:
-            arg = context.args[0].lower()
-            if arg in ['on', 'enable', '1', 'true']:
-                auto_delete_joins = True
-                await update.message.reply_text("✅ Automatic join/leave message deletion is now ON!")
-            elif arg in ['off', 'disable', '0', 'false']:
-                auto_delete_joins = False
-                await update.message.reply_text("✅ Automatic join/leave message deletion is now OFF!")
-            else:
-                await update.message.reply_text("❌ Use: `/joins on` or `/joins off`", parse_mode='Markdown')
-        else:
-            auto_delete_joins = not auto_delete_joins
-            status = "ON" if auto_delete_joins else "OFF"
-            await update.message.reply_text(f"✅ Automatic join/leave message deletion is now {status}!")
+        value = _parse_toggle(context.args, auto_delete_joins)
+        if value is None:
+            await update.message.reply_text("❌ Use: `/joins on` or `/joins off`", parse_mode='Markdown')
+            return
+        
+        auto_delete_joins = value
+        status = "ON" if value else "OFF"
+        await update.message.reply_text(f"✅ Automatic join/leave message deletion is now {status}!")
     
+    @admin_only
     async def toggle_promotions(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Toggle automatic promotional message deletion"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
         global auto_delete_promotions
         
-        if context.args:
-            arg = context.args[0].lower()
-            if arg in ['on', 'enable', '1', 'true']:
-                auto_delete_promotions = True
-                await update.message.reply_text("✅ Automatic promotional message deletion is now ON!")
-            elif arg in ['off', 'disable', '0', 'false']:
-                auto_delete_promotions = False
-                await update.message.reply_text("✅ Automatic promotional message deletion is now OFF!")
-            else:
-                await update.message.reply_text("❌ Use: `/promos on` or `/promos off`", parse_mode='Markdown')
-        else:
-            auto_delete_promotions = not auto_delete_promotions
-            status = "ON" if auto_delete_promotions else "OFF"
-            await update.message.reply_text(f"✅ Automatic promotional message deletion is now {status}!")
+        value = _parse_toggle(context.args, auto_delete_promotions)
+        if value is None:
+            await update.message.reply_text("❌ Use: `/promos on` or `/promos off`", parse_mode='Markdown')
+            return
+        
+        auto_delete_promotions = value
+        status = "ON" if value else "OFF"
+        await update.message.reply_text(f"✅ Automatic promotional message deletion is now {status}!")
     
+    @admin_only
     async def flag_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /flag command"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
         if not context.args:
             await update.message.reply_text("❌ Please provide a word to flag!\nExample: `/flag scam`", parse_mode='Markdown')
             return
         
         word = ' '.join(context.args).lower()
-        flagged_words.add(word)
+        _add_word(word, 'flagged')
         await update.message.reply_text(f"✅ Word '{word}' has been flagged! Messages containing this word will be deleted.")
     
+    @admin_only
     async def ban_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /ban command"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
         if not context.args:
             await update.message.reply_text("❌ Please provide a word to ban!\nExample: `/ban scam`", parse_mode='Markdown')
             return
         
         word = ' '.join(context.args).lower()
-        banned_words.add(word)
+        _add_word(word, 'banned')
         await update.message.reply_text(f"✅ Word '{word}' has been banned! Messages containing this word will be deleted.")
     
+    @admin_only
     async def unflag_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /unflag command"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
         if not context.args:
             await update.message.reply_text("❌ Please provide a word to unflag!")
             return
         
         word = ' '.join(context.args).lower()
         if word in flagged_words:
-            flagged_words.remove(word)
+            _remove_word(word, 'flagged')
             await update.message.reply_text(f"✅ Word '{word}' has been unflagged!")
         else:
             await update.message.reply_text(f"❌ Word '{word}' is not in the flagged list!")
     
+    @admin_only
     async def unban_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /unban command"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
         if not context.args:
             await update.message.reply_text("❌ Please provide a word to unban!")
             return
         
         word = ' '.join(context.args).lower()
         if word in banned_words:
-            banned_words.remove(word)
+            _remove_word(word, 'banned')
             await update.message.reply_text(f"✅ Word '{word}' has been unbanned!")
         else:
             await update.message.reply_text(f"❌ Word '{word}' is not in the banned list!")
     
+    @admin_only
     async def list_words(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List all flagged and banned words"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
-        message = "📋 **Current Settings:**\n\n"
+        lines = ["📋 **Current Settings:**", ""]
         
         if flagged_words:
-            message += "🚩 **Flagged Words:**\n"
-            for word in sorted(flagged_words):
-                message += f"• {word}\n"
+            lines.append("🚩 **Flagged Words:**")
+            lines.extend(f"• {word}" for word in sorted(flagged_words))
         else:
-            message += "🚩 **Flagged Words:** None\n"
+            lines.append("🚩 **Flagged Words:** None")
         
-        message += "\n"
+        lines.append("")
         
         if banned_words:
-            message += "🚫 **Banned Words:**\n"
-            for word in sorted(banned_words):
-                message += f"• {word}\n"
+            lines.append("🚫 **Banned Words:**")
+            lines.extend(f"• {word}" for word in sorted(banned_words))
         else:
-            message += "🚫 **Banned Words:** None\n"
-        
-        link_status = "ON" if auto_delete_links else "OFF"
-        join_status = "ON" if auto_delete_joins else "OFF"
-        promo_status = "ON" if auto_delete_promotions else "OFF"
+            lines.append("🚫 **Banned Words:** None")
         
-        message += f"\n🔗 **Link Deletion:** {link_status}"
-        message += f"\n👋 **Join Message Deletion:** {join_status}"
-        message += f"\n📢 **Promotional Message Deletion:** {promo_status}"
+        lines.append(_LIST_STATUS_TEMPLATE.format(
+            link_status="ON" if auto_delete_links else "OFF",
+            join_status="ON" if auto_delete_joins else "OFF",
+            promo_status="ON" if auto_delete_promotions else "OFF"
+        ))
         
-        await update.message.reply_text(message, parse_mode='Markdown')
+        await update.message.reply_text("\n".join(lines), parse_mode='Markdown')
     
+    @admin_only
     async def toggle_links(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Toggle automatic link deletion"""
-        if not await self.is_admin(update, context):
-            await update.message.reply_text("❌ Only admins can use this command!")
-            return
-        
         global auto_delete_links
         
-        if context.args:
-            arg = context.args[0].lower()
-            if arg in ['on', 'enable', '1', 'true']:
-                auto_delete_links = True
-                await update.message.reply_text("✅ Automatic link deletion is now ON!")
-            elif arg in ['off', 'disable', '0', 'false']:
-                auto_delete_links = False
-                await update.message.reply_text("✅ Automatic link deletion is now OFF!")
-            else:
-                await update.message.reply_text("❌ Use: `/links on` or `/links off`", parse_mode='Markdown')
-        else:
-            auto_delete_links = not auto_delete_links
-            status = "ON" if auto_delete_links else "OFF"
-            await update.message.reply_text(f"✅ Automatic link deletion is now {status}!")
+        value = _parse_toggle(context.args, auto_delete_links)
+        if value is None:
+            await update.message.reply_text("❌ Use: `/links on` or `/links off`", parse_mode='Markdown')
+            return
+        
+        auto_delete_links = value
+        status = "ON" if value else "OFF"
+        await update.message.reply_text(f"✅ Automatic link deletion is now {status}!")
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show help message"""
         if not await self.is_admin(update, context):
             return  # Don't reply if not admin
         
-        help_text = """🤖 **Message Deleter Bot Help**
-
-**Commands:**
-• `/start` - Initialize bot and show status
-• `/flag <word>` - Add word to auto-delete list
-• `/ban <word>` - Add word to ban list (same as flag)
-• `/unflag <word>` - Remove word from flag list
-• `/unban <word>` - Remove word from ban list
-• `/list` - Show all settings and word lists
-• `/links on/off` - Toggle automatic link deletion
-• `/joins on/off` - Toggle join/leave message deletion
-• `/promos on/off` - Toggle promotional message deletion
-• `/help` - Show this help message
-
-**Examples:**
-• `/flag scam` - Delete messages containing "scam"
-• `/ban help` - Delete messages containing "help"
-• `/links on` - Enable automatic link deletion
-• `/joins on` - Enable join message deletion
-• `/promos on` - Enable promotional message deletion
-
-**Features:**
-• Automatically deletes messages with flagged/banned words
-• Can delete messages containing links (when enabled)
-• Deletes join/leave messages (when enabled)
-• Detects and deletes promotional/spam messages (when enabled)
-• Only admins can control the bot
-• Works only when bot has admin privileges
-
-**Promotional Message Detection:**
-The bot can detect promotional messages by looking for:
-• Airdrop/token/crypto related keywords
-• Bot mentions with promotional content
-• Excessive emoji usage with promotional content
-• Specific spam patterns
-
-**Note:** Bot must be admin in the group to delete messages!"""
-        
-        await update.message.reply_text(help_text, parse_mode='Markdown')
+        await update.message.reply_text(_HELP_TEXT, parse_mode='Markdown')
+    
+    def queue_delete(self, message: Message, username: str, reason: str):
+        """Queue a message for the next batched delete in its chat"""
+        chat_id = message.chat_id
+        pending = self._pending_deletes.setdefault(chat_id, [])
+        pending.append((message.message_id, username, reason))
+        
+        if len(pending) >= _DELETE_BATCH_MAX:
+            self.flush_deletes(chat_id)
+        elif chat_id not in self._flush_handles:
+            self._flush_handles[chat_id] = asyncio.get_running_loop().call_later(
+                _DELETE_BATCH_DELAY, self.flush_deletes, chat_id
+            )
+    
+    def flush_deletes(self, chat_id: int):
+        """Send the queued messages of a chat off for deletion"""
+        handle = self._flush_handles.pop(chat_id, None)
+        if handle:
+            handle.cancel()
+        pending = self._pending_deletes.pop(chat_id, None)
+        if pending:
+            self.application.create_task(self.delete_batch(chat_id, pending))
+    
+    async def delete_batch(self, chat_id: int, pending: list[tuple[int, str, str]]):
+        """Delete a batch of messages with one deleteMessages call"""
+        try:
+            await self.application.bot.delete_messages(chat_id, [message_id for message_id, _, _ in pending])
+            # deleteMessages silently skips messages it cannot delete, so log the request as a whole
+            details = "; ".join(f"{username} - {reason}" for _, username, reason in pending)
+            logger.info(f"Sent delete for {len(pending)} message(s) in chat {chat_id}: {details}")
+        except Exception as e:
+            logger.error(f"Failed to delete {len(pending)} message(s): {e}")
+    
+    async def flush_all_deletes(self, application: Application):
+        """Send deletes still queued when polling stops, while the loop is running"""
+        for chat_id in list(self._pending_deletes):
+            handle = self._flush_handles.pop(chat_id, None)
+            if handle:
+                handle.cancel()
+            await self.delete_batch(chat_id, self._pending_deletes.pop(chat_id))
     
     async def monitor_messages(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Monitor messages for flagged/banned words, links, and promotional content"""
@@ -410,66 +693,47 @@ The bot can detect promotional messages by looking for:
             if not update.message or not update.message.text:
                 return
             
-            # Skip if bot is not admin
-            if not await self.is_bot_admin(update, context):
-                return
-            
-            # Skip admin messages
-            if await self.is_admin(update, context):
-                return
-            
-            message_text = update.message.text.lower()
             original_text = update.message.text
+            # Lowered copy shared by word and promo checks, skipped if neither runs
+            need_lower = flagged_words or banned_words or auto_delete_promotions
+            message_text = original_text.lower() if need_lower else ''
             should_delete = False
             reason = ""
             
-            # Check for flagged words
-            for word in flagged_words:
-                if word in message_text:
-                    should_delete = True
-                    reason = f"flagged word: '{word}'"
-                    break
-            
-            # Check for banned words
-            if not should_delete:
-                for word in banned_words:
-                    if word in message_text:
-                        should_delete = True
-                        reason = f"banned word: '{word}'"
-                        break
+            # Check for flagged/banned words in a single pass
+            match = _find_word(original_text, message_text)
+            if match:
+                kind, word = match
+                should_delete = True
+                reason = f"{kind} word: '{word}'"
             
             # Check for promotional messages
             if not should_delete and auto_delete_promotions:
-                if self.is_promotional_message(original_text):
+                if self.is_promotional_message(original_text, message_text):
                     should_delete = True
                     reason = "promotional/spam content"
             
             # Check for links if enabled
             if not should_delete and auto_delete_links:
-                # Enhanced regex pattern for URLs and common link formats
-                url_patterns = [
-                    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+',
-                    r'www\.(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+',
-                    r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}',
-                    r't\.me/\w+',
-                    r'@\w+\.\w+'
-                ]
-                
-                for pattern in url_patterns:
-                    if re.search(pattern, original_text, re.IGNORECASE):
-                        should_delete = True
-                        reason = "contains link"
-                        break
+                if _has_link(original_text):
+                    should_delete = True
+                    reason = "contains link"
+            
+            if not should_delete:
+                return
             
-            # Delete message if needed
-            if should_delete:
-                try:
-                    await update.message.delete()
-                    username = update.effective_user.username or update.effective_user.first_name or "Unknown"
-                    logger.info(f"Deleted message from {username} - {reason}")
-                except Exception as e:
-                    logger.error(f"Failed to delete message: {e}")
-                    
+            # Skip admin messages (checked last, these may need API calls)
+            if await self.is_admin(update, context):
+                return
+            
+            # Skip if bot is not admin
+            if not await self.is_bot_admin(update, context):
+                return
+            
+            # Delete message in a batch with other hits in this chat
+            username = update.effective_user.username or update.effective_user.first_name or "Unknown"
+            self.queue_delete(update.message, username, reason)
+                
         except Exception as e:
             logger.error(f"Error in monitor_messages: {e}")
     
@@ -477,11 +741,16 @@ The bot can detect promotional messages by looking for:
         """Start the bot"""
         logger.info("Starting Message Deleter Bot...")
         self.application.run_polling(allowed_updates=Update.ALL_TYPES)
+        if _rebuild_handle:
+            _rebuild()  # Save changes still waiting on the rebuild delay
 
 if __name__ == '__main__':
     if not BOT_TOKEN:
         logger.error("BOT_TOKEN environment variable is required!")
         exit(1)
     
+    if uvloop:
+        uvloop.install()
+    
     bot = MessageDeleterBot()
     bot.run()